@@ -1,6 +1,9 @@
 """Admin configuration for Online Course Application models."""
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.db.models import Q
 from models.user_model import User
 from models.course_model import Course, Category
 from models.content_model import Content, Video, Document
@@ -47,6 +50,8 @@ class CourseAdmin(admin.ModelAdmin):
     list_display = ['title', 'teacher', 'category', 'level', 'status', 'price', 'rating', 'enrolled_count', 'created_at']
     list_filter = ['status', 'level', 'category', 'is_featured', 'created_at']
     search_fields = ['title', 'description', 'teacher__username']
+    list_select_related = ['teacher', 'category']
+    autocomplete_fields = ['teacher', 'category']
     prepopulated_fields = {'slug': ('title',)}
     readonly_fields = ['rating', 'total_ratings', 'created_at', 'updated_at']
     
@@ -68,6 +73,19 @@ class CourseAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_enrolled_count()
+    
+    def get_search_results(self, request, queryset, search_term):
+        """Use the GIN-indexed search vector instead of scanning descriptions on PostgreSQL."""
+        if not search_term or connection.vendor != 'postgresql':
+            return super().get_search_results(request, queryset, search_term)
+        queryset = queryset.filter(
+            Q(search_vector=SearchQuery(search_term)) |
+            Q(teacher__username__icontains=search_term)
+        )
+        return queryset, False
 
 
 class AnswerInline(admin.TabularInline):
@@ -83,6 +101,7 @@ class QuestionAdmin(admin.ModelAdmin):
     list_display = ['exam', 'question_type', 'marks', 'order']
     list_filter = ['question_type', 'exam']
     search_fields = ['question_text', 'exam__title']
+    list_select_related = ['exam', 'exam__course']
     inlines = [AnswerInline]
 
 
@@ -92,6 +111,8 @@ class ExamAdmin(admin.ModelAdmin):
     list_display = ['title', 'course', 'exam_type', 'is_published', 'duration_minutes', 'total_marks', 'passing_marks']
     list_filter = ['exam_type', 'is_published', 'is_required', 'created_at']
     search_fields = ['title', 'course__title']
+    list_select_related = ['course']
+    autocomplete_fields = ['course']
     readonly_fields = ['created_at', 'updated_at']
 
 
@@ -101,6 +122,9 @@ class ExamResultAdmin(admin.ModelAdmin):
     list_display = ['exam', 'student', 'attempt_number', 'status', 'score', 'percentage', 'is_passed', 'started_at']
     list_filter = ['status', 'is_passed', 'started_at']
     search_fields = ['exam__title', 'student__username']
+    list_select_related = ['exam', 'exam__course', 'student']
+    list_per_page = 50
+    show_full_result_count = False
     readonly_fields = ['started_at', 'submitted_at', 'graded_at']
 
 
@@ -110,6 +134,8 @@ class ContentAdmin(admin.ModelAdmin):
     list_display = ['title', 'course', 'content_type', 'order', 'is_mandatory', 'is_preview', 'created_at']
     list_filter = ['content_type', 'is_mandatory', 'is_preview', 'created_at']
     search_fields = ['title', 'course__title']
+    list_select_related = ['course']
+    autocomplete_fields = ['course']
     ordering = ['course', 'order']
 
 
@@ -118,6 +144,7 @@ class VideoAdmin(admin.ModelAdmin):
     """Admin configuration for Video model."""
     list_display = ['content', 'quality', 'file_size_mb']
     search_fields = ['content__title']
+    list_select_related = ['content', 'content__course']
 
 
 @admin.register(Document)
@@ -125,6 +152,7 @@ class DocumentAdmin(admin.ModelAdmin):
     """Admin configuration for Document model."""
     list_display = ['content', 'file_size_mb', 'download_count']
     search_fields = ['content__title']
+    list_select_related = ['content', 'content__course']
 
 
 @admin.register(Enrollment)
@@ -133,6 +161,10 @@ class EnrollmentAdmin(admin.ModelAdmin):
     list_display = ['student', 'course', 'status', 'progress_percentage', 'enrolled_at', 'is_active']
     list_filter = ['status', 'is_active', 'enrolled_at']
     search_fields = ['student__username', 'course__title']
+    list_select_related = ['student', 'course']
+    list_per_page = 50
+    show_full_result_count = False
+    autocomplete_fields = ['student', 'course']
     readonly_fields = ['enrolled_at', 'completed_at', 'last_accessed_at']
     
     fieldsets = (
@@ -157,6 +189,7 @@ class CertificateAdmin(admin.ModelAdmin):
     list_display = ['certificate_number', 'enrollment', 'issued_date', 'is_verified']
     list_filter = ['is_verified', 'issued_date']
     search_fields = ['certificate_number', 'verification_code', 'enrollment__student__username']
+    list_select_related = ['enrollment', 'enrollment__student', 'enrollment__course']
     readonly_fields = ['certificate_number', 'verification_code', 'issued_date']
 
 
@@ -166,6 +199,10 @@ class ProgressAdmin(admin.ModelAdmin):
     list_display = ['student', 'course', 'total_time_spent_minutes', 'last_accessed_at']
     list_filter = ['last_accessed_at']
     search_fields = ['student__username', 'course__title']
+    list_select_related = ['student', 'course']
+    list_per_page = 50
+    show_full_result_count = False
+    autocomplete_fields = ['student', 'course']
 
 
 @admin.register(ContentProgress)
@@ -174,6 +211,9 @@ class ContentProgressAdmin(admin.ModelAdmin):
     list_display = ['progress', 'content', 'is_completed', 'time_spent_minutes', 'completed_at']
     list_filter = ['is_completed', 'completed_at']
     search_fields = ['progress__student__username', 'content__title']
+    list_select_related = ['progress', 'progress__student', 'progress__course', 'content', 'content__course']
+    list_per_page = 50
+    show_full_result_count = False
 
 
 # Customize admin site
@@ -16,7 +16,8 @@ INSTALLED_APPS = [
     'administration',
     
     # Django apps
-    'django.contrib.admin',
+    # Admin modules are discovered from config/urls.py instead of at startup
+    'django.contrib.admin.apps.SimpleAdminConfig',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -13,13 +13,17 @@ from controllers.student_controller import (
 )
 from controllers.teacher_controller import (
     TeacherDashboardView, MyCoursesView, CreateCourseView, EditCourseView,
-    StudentsListView, CreateExamView, add_content, delete_course
+    StudentsListView, CreateExamView, add_content, bulk_add_content, delete_course
 )
 from controllers.admin_controller import (
     AdminDashboardView, UsersManagementView, CoursesManagementView,
     ReportsView, toggle_user_status, approve_course, reject_course
 )
 
+# Register ModelAdmins only when the URLconf is loaded (web processes),
+# not for every management command or worker that sets up Django.
+admin.autodiscover()
+
 urlpatterns = [
     # Django admin
     path('admin/', admin.site.urls),
@@ -52,6 +56,7 @@ urlpatterns = [
     path('teacher/edit-course/<slug:course_slug>/', EditCourseView.as_view(), name='edit_course'),
     path('teacher/delete-course/<slug:course_slug>/', delete_course, name='delete_course'),
     path('teacher/add-content/<slug:course_slug>/', add_content, name='add_content'),
+    path('teacher/bulk-add-content/<slug:course_slug>/', bulk_add_content, name='bulk_add_content'),
     path('teacher/students/', StudentsListView.as_view(), name='students_list'),
     path('teacher/students/<slug:course_slug>/', StudentsListView.as_view(), name='course_students'),
     path('teacher/create-exam/', CreateExamView.as_view(), name='create_exam'),
@@ -66,7 +71,6 @@ urlpatterns = [
     path('admin-panel/courses/<int:course_id>/reject/', reject_course, name='reject_course'),
     
     # REST API endpoints
-    path('api/', include('rest_framework.urls')),
     path('api/auth/', include('rest_framework.urls', namespace='rest_framework')),
 ]
 
@@ -1,16 +1,19 @@
 """Admin controller for admin-specific views (custom admin panel)."""
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
+from django.http import Http404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.generic import TemplateView
+from django.core.paginator import Paginator
 from django.utils.decorators import method_decorator
-from django.db.models import Count, Avg, Q, Sum
+from django.db.models import Count, Avg, Q, Sum, Case, When, Value, BooleanField
 from django.utils import timezone
 from datetime import timedelta
 from utils.decorators import admin_required
+from utils.cache import get_categories
 from models.user_model import User
 from models.course_model import Course, Category
-from models.enrollment_model import Enrollment, Certificate
+from models.enrollment_model import Enrollment
 from models.exam_model import Exam, ExamResult
 
 
@@ -22,29 +25,55 @@ class AdminDashboardView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
+        last_week = timezone.now() - timedelta(days=7)
+        
         # Genel İstatistikler
-        context['total_users'] = User.objects.count()
-        context['total_students'] = User.objects.filter(role='STUDENT').count()
-        context['total_teachers'] = User.objects.filter(role='TEACHER').count()
-        context['total_courses'] = Course.objects.count()
-        context['published_courses'] = Course.objects.filter(status='PUBLISHED').count()
-        context['total_enrollments'] = Enrollment.objects.count()
-        context['total_certificates'] = Certificate.objects.count()
+        user_stats = User.objects.aggregate(
+            total=Count('id'),
+            students=Count('id', filter=Q(role='STUDENT')),
+            teachers=Count('id', filter=Q(role='TEACHER')),
+            new_week=Count('id', filter=Q(date_joined__gte=last_week)),
+        )
+        course_stats = Course.objects.aggregate(
+            total=Count('id'),
+            published=Count('id', filter=Q(status='PUBLISHED')),
+        )
+        # Certificate is one-to-one with Enrollment, so the join adds no rows
+        enrollment_stats = Enrollment.objects.aggregate(
+            total=Count('id'),
+            new_week=Count('id', filter=Q(enrolled_at__gte=last_week)),
+            certificates=Count('certificate'),
+        )
+        
+        context['total_users'] = user_stats['total']
+        context['total_students'] = user_stats['students']
+        context['total_teachers'] = user_stats['teachers']
+        context['total_courses'] = course_stats['total']
+        context['published_courses'] = course_stats['published']
+        context['total_enrollments'] = enrollment_stats['total']
+        context['total_certificates'] = enrollment_stats['certificates']
         
         # Son 7 günlük istatistikler
-        last_week = timezone.now() - timedelta(days=7)
-        context['new_users_week'] = User.objects.filter(date_joined__gte=last_week).count()
-        context['new_enrollments_week'] = Enrollment.objects.filter(enrolled_at__gte=last_week).count()
+        context['new_users_week'] = user_stats['new_week']
+        context['new_enrollments_week'] = enrollment_stats['new_week']
         
         # En popüler kurslar
-        context['popular_courses'] = Course.objects.annotate(
-            enrollment_count=Count('enrollments')
+        context['popular_courses'] = Course.objects.with_stats().select_related(
+            'teacher', 'category'
+        ).only(
+            'id', 'title', 'slug', 'rating',
+            'teacher__username', 'teacher__first_name', 'teacher__last_name',
+            'category__name'
         ).order_by('-enrollment_count')[:5]
         
         # Son kayıtlar
-        context['recent_users'] = User.objects.order_by('-date_joined')[:10]
+        context['recent_users'] = User.objects.only(
+            'id', 'username', 'email', 'first_name', 'last_name', 'role', 'date_joined'
+        ).order_by('-date_joined')[:10]
         context['recent_enrollments'] = Enrollment.objects.select_related(
             'student', 'course'
+        ).only(
+            'id', 'enrolled_at', 'status', 'student__username', 'course__title', 'course__slug'
         ).order_by('-enrolled_at')[:10]
         
         return context
@@ -62,7 +91,10 @@ class UsersManagementView(TemplateView):
         role = self.request.GET.get('role', '')
         search = self.request.GET.get('search', '')
         
-        users = User.objects.all().order_by('-date_joined')
+        users = User.objects.only(
+            'id', 'username', 'email', 'first_name', 'last_name',
+            'role', 'is_active', 'date_joined'
+        ).order_by('-date_joined')
         
         if role:
             users = users.filter(role=role)
@@ -75,7 +107,10 @@ class UsersManagementView(TemplateView):
                 Q(last_name__icontains=search)
             )
         
-        context['users'] = users
+        page_obj = Paginator(users, 50).get_page(self.request.GET.get('page'))
+        context['page_obj'] = page_obj
+        context['is_paginated'] = page_obj.has_other_pages()
+        context['users'] = page_obj.object_list
         context['current_role'] = role
         context['current_search'] = search
         
@@ -95,8 +130,11 @@ class CoursesManagementView(TemplateView):
         category = self.request.GET.get('category', '')
         search = self.request.GET.get('search', '')
         
-        courses = Course.objects.select_related('teacher', 'category').annotate(
-            enrollment_count=Count('enrollments')
+        courses = Course.objects.with_stats().select_related('teacher', 'category').only(
+            'id', 'title', 'slug', 'status', 'level', 'price', 'rating',
+            'created_at', 'published_at',
+            'teacher__username', 'teacher__first_name', 'teacher__last_name',
+            'category__name', 'category__slug'
         ).order_by('-created_at')
         
         if status:
@@ -106,13 +144,13 @@ class CoursesManagementView(TemplateView):
             courses = courses.filter(category__slug=category)
         
         if search:
-            courses = courses.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search)
-            )
+            courses = courses.search(search)
         
-        context['courses'] = courses
-        context['categories'] = Category.objects.all()
+        page_obj = Paginator(courses, 50).get_page(self.request.GET.get('page'))
+        context['page_obj'] = page_obj
+        context['is_paginated'] = page_obj.has_other_pages()
+        context['courses'] = page_obj.object_list
+        context['categories'] = get_categories()
         context['current_status'] = status
         context['current_category'] = category
         context['current_search'] = search
@@ -129,37 +167,44 @@ class ReportsView(TemplateView):
         context = super().get_context_data(**kwargs)
         
         # Kullanıcı istatistikleri
-        context['user_stats'] = {
-            'total': User.objects.count(),
-            'students': User.objects.filter(role='STUDENT').count(),
-            'teachers': User.objects.filter(role='TEACHER').count(),
-            'admins': User.objects.filter(role='ADMIN').count(),
-            'active': User.objects.filter(is_active=True).count(),
-        }
+        context['user_stats'] = User.objects.aggregate(
+            total=Count('id'),
+            students=Count('id', filter=Q(role='STUDENT')),
+            teachers=Count('id', filter=Q(role='TEACHER')),
+            admins=Count('id', filter=Q(role='ADMIN')),
+            active=Count('id', filter=Q(is_active=True)),
+        )
         
         # Kurs istatistikleri
-        context['course_stats'] = {
-            'total': Course.objects.count(),
-            'published': Course.objects.filter(status='PUBLISHED').count(),
-            'draft': Course.objects.filter(status='DRAFT').count(),
-            'pending': Course.objects.filter(status='PENDING').count(),
-            'avg_rating': Course.objects.aggregate(Avg('rating'))['rating__avg'] or 0,
-        }
+        course_stats = Course.objects.aggregate(
+            total=Count('id'),
+            published=Count('id', filter=Q(status='PUBLISHED')),
+            draft=Count('id', filter=Q(status='DRAFT')),
+            pending=Count('id', filter=Q(status='PENDING')),
+            avg_rating=Avg('rating'),
+        )
+        course_stats['avg_rating'] = course_stats['avg_rating'] or 0
+        context['course_stats'] = course_stats
         
         # Kayıt istatistikleri
-        context['enrollment_stats'] = {
-            'total': Enrollment.objects.count(),
-            'completed': Enrollment.objects.filter(is_completed=True).count(),
-            'in_progress': Enrollment.objects.filter(is_completed=False).count(),
-        }
+        context['enrollment_stats'] = Enrollment.objects.aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status='COMPLETED')),
+            in_progress=Count('id', filter=~Q(status='COMPLETED')),
+        )
         
         # Sınav istatistikleri
-        exam_results = ExamResult.objects.all()
+        exam_stats = ExamResult.objects.aggregate(
+            total_attempts=Count('id'),
+            avg_score=Avg('score'),
+            passed=Count('id', filter=Q(is_passed=True)),
+        )
+        total_attempts = exam_stats['total_attempts']
         context['exam_stats'] = {
             'total_exams': Exam.objects.count(),
-            'total_attempts': exam_results.count(),
-            'avg_score': exam_results.aggregate(Avg('score'))['score__avg'] or 0,
-            'pass_rate': (exam_results.filter(passed=True).count() / exam_results.count() * 100) if exam_results.count() > 0 else 0,
+            'total_attempts': total_attempts,
+            'avg_score': exam_stats['avg_score'] or 0,
+            'pass_rate': (exam_stats['passed'] / total_attempts * 100) if total_attempts else 0,
         }
         
         # Kategori bazlı istatistikler
@@ -175,26 +220,45 @@ class ReportsView(TemplateView):
 @admin_required
 def toggle_user_status(request, user_id):
     """Toggle user active status."""
-    user = get_object_or_404(User, id=user_id)
-    user.is_active = not user.is_active
-    user.save()
+    updated = User.objects.filter(id=user_id).update(
+        is_active=Case(
+            When(is_active=True, then=Value(False)),
+            default=Value(True),
+            output_field=BooleanField()
+        ),
+        updated_at=timezone.now()
+    )
+    if not updated:
+        raise Http404('User not found.')
     
-    status = "aktif" if user.is_active else "pasif"
-    messages.success(request, f'{user.username} kullanıcısı {status} duruma getirildi.')
+    username, is_active = User.objects.filter(id=user_id).values_list('username', 'is_active').get()
+    status = "aktif" if is_active else "pasif"
+    messages.success(request, f'{username} kullanıcısı {status} duruma getirildi.')
     
     return redirect('users_management')
 
 
+def _get_course_title(course_id):
+    """Return a course title, raising Http404 if the course does not exist."""
+    title = Course.objects.filter(id=course_id).values_list('title', flat=True).first()
+    if title is None:
+        raise Http404('Course not found.')
+    return title
+
+
 @login_required
 @admin_required
 def approve_course(request, course_id):
     """Approve a pending course."""
-    course = get_object_or_404(Course, id=course_id)
-    course.status = 'PUBLISHED'
-    course.published_at = timezone.now()
-    course.save()
+    title = _get_course_title(course_id)
+    now = timezone.now()
+    Course.objects.filter(id=course_id).update(
+        status='PUBLISHED',
+        published_at=now,
+        updated_at=now
+    )
     
-    messages.success(request, f'{course.title} kursu onaylandı ve yayınlandı.')
+    messages.success(request, f'{title} kursu onaylandı ve yayınlandı.')
     return redirect('courses_management')
 
 
@@ -202,9 +266,11 @@ def approve_course(request, course_id):
 @admin_required
 def reject_course(request, course_id):
     """Reject a pending course."""
-    course = get_object_or_404(Course, id=course_id)
-    course.status = 'DRAFT'
-    course.save()
+    title = _get_course_title(course_id)
+    Course.objects.filter(id=course_id).update(
+        status='DRAFT',
+        updated_at=timezone.now()
+    )
     
-    messages.warning(request, f'{course.title} kursu reddedildi.')
+    messages.warning(request, f'{title} kursu reddedildi.')
     return redirect('courses_management')
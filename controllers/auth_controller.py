@@ -6,8 +6,17 @@ from django.contrib import messages
 from django.views.generic import TemplateView
 from django.views import View
 from django.utils.decorators import method_decorator
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from models.user_model import User
 
+# Dashboard URL name for each user role
+ROLE_DASHBOARDS = {
+    User.Role.ADMIN: 'admin_dashboard',
+    User.Role.TEACHER: 'teacher_dashboard',
+    User.Role.STUDENT: 'student_dashboard',
+}
+
 
 class LoginView(View):
     """User login view."""
@@ -29,12 +38,7 @@ class LoginView(View):
             messages.success(request, f'Welcome back, {user.username}!')
             
             # Redirect based on user role
-            if user.is_admin:
-                return redirect('admin_dashboard')
-            elif user.is_teacher:
-                return redirect('teacher_dashboard')
-            else:
-                return redirect('student_dashboard')
+            return redirect(ROLE_DASHBOARDS.get(user.role, 'student_dashboard'))
         else:
             messages.error(request, 'Invalid username or password.')
             return render(request, self.template_name)
@@ -63,37 +67,44 @@ class RegisterView(View):
             messages.error(request, 'Passwords do not match.')
             return render(request, self.template_name)
         
-        if User.objects.filter(username=username).exists():
-            messages.error(request, 'Username already exists.')
-            return render(request, self.template_name)
+        existing_username = User.objects.filter(
+            Q(username=username) | Q(email=email)
+        ).values_list('username', flat=True).first()
         
-        if User.objects.filter(email=email).exists():
-            messages.error(request, 'Email already exists.')
+        if existing_username is not None:
+            if existing_username == username:
+                messages.error(request, 'Username already exists.')
+            else:
+                messages.error(request, 'Email already exists.')
             return render(request, self.template_name)
         
         # Create user
         try:
-            user = User.objects.create_user(
-                username=username,
-                email=email,
-                password=password,
-                role=role,
-                first_name=first_name,
-                last_name=last_name
-            )
-            
-            login(request, user)
-            messages.success(request, 'Registration successful!')
-            
-            # Redirect based on role
-            if role == 'TEACHER':
-                return redirect('teacher_dashboard')
-            else:
-                return redirect('student_dashboard')
-                
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=username,
+                    email=email,
+                    password=password,
+                    role=role,
+                    first_name=first_name,
+                    last_name=last_name
+                )
+        except IntegrityError:
+            # Username was taken by a concurrent registration
+            messages.error(request, 'Username already exists.')
+            return render(request, self.template_name)
         except Exception as e:
             messages.error(request, f'Registration failed: {str(e)}')
             return render(request, self.template_name)
+        
+        login(request, user)
+        messages.success(request, 'Registration successful!')
+        
+        # Redirect based on role
+        if role == 'TEACHER':
+            return redirect('teacher_dashboard')
+        else:
+            return redirect('student_dashboard')
 
 
 class LogoutView(View):
@@ -117,25 +128,32 @@ class ProfileView(View):
         user = request.user
         
         # Update basic info
-        user.first_name = request.POST.get('first_name', user.first_name)
-        user.last_name = request.POST.get('last_name', user.last_name)
-        user.email = request.POST.get('email', user.email)
-        user.phone_number = request.POST.get('phone_number', user.phone_number)
-        user.bio = request.POST.get('bio', user.bio)
+        fields = ['first_name', 'last_name', 'email', 'phone_number', 'bio']
+        
+        # Update role-specific fields
+        if user.is_teacher:
+            fields += ['expertise', 'qualification']
+        elif user.is_student:
+            fields += ['education_level']
+        
+        changed = []
+        for field in fields:
+            value = request.POST.get(field, getattr(user, field))
+            if value != getattr(user, field):
+                setattr(user, field, value)
+                changed.append(field)
         
         # Handle profile picture upload
         if 'profile_picture' in request.FILES:
             user.profile_picture = request.FILES['profile_picture']
+            changed.append('profile_picture')
         
-        # Update role-specific fields
-        if user.is_teacher:
-            user.expertise = request.POST.get('expertise', user.expertise)
-            user.qualification = request.POST.get('qualification', user.qualification)
-        elif user.is_student:
-            user.education_level = request.POST.get('education_level', user.education_level)
+        if not changed:
+            messages.info(request, 'No changes to save.')
+            return redirect('profile')
         
         try:
-            user.save()
+            user.save(update_fields=changed + ['updated_at'])
             messages.success(request, 'Profile updated successfully!')
         except Exception as e:
             messages.error(request, f'Update failed: {str(e)}')
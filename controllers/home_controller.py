@@ -1,40 +1,72 @@
 """Home controller for public pages."""
 from django.shortcuts import render
 from django.views.generic import TemplateView
-from django.db.models import Count, Avg
+from django.db.models import Count, Avg, Q
 from models.course_model import Course, Category
 from models.user_model import User
+from utils.cache import HOME_COURSES_CACHE_KEY, HOME_STATS_CACHE_KEY, get_or_set_stale
 
+# Home page data is served from cache for up to an hour and refreshed
+# in the background once it is older than five minutes.
+HOME_CACHE_SOFT_TIMEOUT = 60 * 5
+HOME_CACHE_HARD_TIMEOUT = 60 * 60
 
-class HomeView(TemplateView):
-    """Home page view."""
-    template_name = 'index.html'
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        
+
+def get_home_courses():
+    """Featured courses, popular courses and categories for the home page."""
+    return {
         # Get featured courses
-        context['featured_courses'] = Course.objects.filter(
+        'featured_courses': list(Course.objects.filter(
             status='PUBLISHED',
             is_featured=True
-        ).select_related('teacher', 'category')[:6]
+        ).with_stats().select_related('teacher', 'category').only(
+            'id', 'title', 'slug', 'description', 'thumbnail', 'level', 'price', 'rating',
+            'teacher__username', 'teacher__first_name', 'teacher__last_name',
+            'category__name', 'category__slug'
+        )[:6]),
         
         # Get popular courses (by enrollment count)
-        context['popular_courses'] = Course.objects.filter(
+        'popular_courses': list(Course.objects.filter(
             status='PUBLISHED'
-        ).annotate(
-            enrolled_count=Count('enrollments')
-        ).order_by('-enrolled_count')[:6]
+        ).with_stats().order_by('-enrollment_count')[:6]),
         
         # Get categories with course count
-        context['categories'] = Category.objects.annotate(
+        'categories': list(Category.objects.annotate(
             course_count=Count('courses')
-        ).filter(course_count__gt=0)[:8]
+        ).filter(course_count__gt=0)[:8]),
+    }
+
+
+def get_home_stats():
+    """Platform statistics for the home page."""
+    user_stats = User.objects.aggregate(
+        students=Count('id', filter=Q(role='STUDENT')),
+        teachers=Count('id', filter=Q(role='TEACHER')),
+    )
+    return {
+        'total_courses': Course.objects.filter(status='PUBLISHED').count(),
+        'total_students': user_stats['students'],
+        'total_teachers': user_stats['teachers'],
+    }
+
+
+class HomeView(TemplateView):
+    """Home page view."""
+    template_name = 'index.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        
+        context.update(get_or_set_stale(
+            HOME_COURSES_CACHE_KEY, get_home_courses,
+            HOME_CACHE_SOFT_TIMEOUT, HOME_CACHE_HARD_TIMEOUT
+        ))
         
         # Statistics
-        context['total_courses'] = Course.objects.filter(status='PUBLISHED').count()
-        context['total_students'] = User.objects.filter(role='STUDENT').count()
-        context['total_teachers'] = User.objects.filter(role='TEACHER').count()
+        context.update(get_or_set_stale(
+            HOME_STATS_CACHE_KEY, get_home_stats,
+            HOME_CACHE_SOFT_TIMEOUT, HOME_CACHE_HARD_TIMEOUT
+        ))
         
         return context
 
@@ -3,16 +3,19 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.generic import ListView, DetailView
+from django.utils import timezone
 from django.utils.decorators import method_decorator
-from django.db.models import Q, Avg, Count
-from utils.decorators import student_required, enrollment_required
-from models.course_model import Course, Category
-from models.enrollment_model import Enrollment, Certificate
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Avg, Count, Max, Prefetch
+from utils.decorators import student_required, enrollment_exists_required
+from utils.cache import get_categories
+from utils.pagination import CursorPaginationMixin
+from models.course_model import Course, LISTING_DEFERRED_FIELDS
+from models.enrollment_model import Enrollment
 from models.exam_model import Exam, ExamResult
 from models.progress_model import Progress, ContentProgress
 from models.content_model import Content
-from models.question_model import Question, Answer
-from datetime import datetime
+from models.question_model import Question, Answer, StudentAnswer
 
 
 @method_decorator([login_required, student_required], name='dispatch')
@@ -31,12 +34,14 @@ class StudentDashboardView(ListView):
         user = self.request.user
         
         # Get overall statistics
-        context['total_enrolled'] = Enrollment.objects.filter(student=user).count()
-        context['completed_courses'] = Enrollment.objects.filter(
-            student=user, 
-            is_completed=True
-        ).count()
-        context['certificates_earned'] = Certificate.objects.filter(student=user).count()
+        stats = Enrollment.objects.filter(student=user).aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status=Enrollment.Status.COMPLETED)),
+            certificates=Count('certificate'),
+        )
+        context['total_enrolled'] = stats['total']
+        context['completed_courses'] = stats['completed']
+        context['certificates_earned'] = stats['certificates']
         
         # Recent exam results
         context['recent_results'] = ExamResult.objects.filter(
@@ -55,15 +60,14 @@ class BrowseCoursesView(ListView):
     paginate_by = 12
     
     def get_queryset(self):
-        queryset = Course.objects.filter(status='PUBLISHED').select_related('teacher', 'category')
+        queryset = Course.objects.filter(
+            status='PUBLISHED'
+        ).select_related('teacher', 'category').for_listing().with_enrolled_count()
         
         # Search
         search = self.request.GET.get('search')
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | 
-                Q(description__icontains=search)
-            )
+            queryset = queryset.search(search)
         
         # Filter by category
         category = self.request.GET.get('category')
@@ -82,32 +86,38 @@ class BrowseCoursesView(ListView):
         elif price == 'paid':
             queryset = queryset.filter(price__gt=0)
         
-        # Sorting
-        sort = self.request.GET.get('sort', '-created_at')
-        queryset = queryset.order_by(sort)
+        # Sorting (searches come ordered from Course.search unless a sort is chosen)
+        sort = self.request.GET.get('sort')
+        if sort:
+            queryset = queryset.order_by(sort)
+        elif not search:
+            queryset = queryset.order_by('-created_at')
         
         return queryset
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = Category.objects.all()
+        context['categories'] = get_categories()
         return context
 
 
 @method_decorator([login_required, student_required], name='dispatch')
-class EnrolledCoursesView(ListView):
+class EnrolledCoursesView(CursorPaginationMixin, ListView):
     """View enrolled courses."""
     template_name = 'student/enrolled_courses.html'
     context_object_name = 'enrollments'
     paginate_by = 12
+    cursor_field = 'enrolled_at'
     
     def get_queryset(self):
         return Enrollment.objects.filter(
             student=self.request.user
-        ).select_related('course', 'course__teacher').order_by('-enrolled_at')
+        ).select_related('course', 'course__teacher').defer(
+            *(f'course__{field}' for field in LISTING_DEFERRED_FIELDS)
+        ).order_by('-enrolled_at')
 
 
-@method_decorator([login_required, student_required, enrollment_required], name='dispatch')
+@method_decorator([login_required, student_required, enrollment_exists_required], name='dispatch')
 class CourseContentView(DetailView):
     """View course content."""
     model = Course
@@ -129,21 +139,34 @@ class CourseContentView(DetailView):
         # Get course contents
         context['contents'] = Content.objects.filter(
             course=course
-        ).order_by('order')
+        ).select_related('video', 'document').order_by('order')
         
-        # Get progress
-        progress, _ = Progress.objects.get_or_create(
+        # Get progress with completed contents prefetched
+        progress = Progress.objects.filter(
             student=user,
             course=course
-        )
+        ).prefetch_related(
+            Prefetch(
+                'content_progress',
+                queryset=ContentProgress.objects.filter(
+                    is_completed=True
+                ).only('id', 'progress_id', 'content_id').order_by(),
+                to_attr='completed_progress'
+            )
+        ).first()
+        if progress is None:
+            # Normally created with the enrollment (see models.signals)
+            progress, _ = Progress.objects.get_or_create(
+                student=user,
+                course=course
+            )
+            progress.completed_progress = []
         context['progress'] = progress
         
-        # Get completed contents
-        completed_contents = ContentProgress.objects.filter(
-            progress=progress,
-            is_completed=True
-        ).values_list('content_id', flat=True)
-        context['completed_contents'] = completed_contents
+        # Get completed contents (set for O(1) membership checks)
+        context['completed_contents'] = {
+            cp.content_id for cp in progress.completed_progress
+        }
         
         return context
 
@@ -154,32 +177,33 @@ def enroll_course(request, course_slug):
     """Enroll in a course."""
     course = get_object_or_404(Course, slug=course_slug, status='PUBLISHED')
     
-    # Check if already enrolled
-    if Enrollment.objects.filter(student=request.user, course=course).exists():
-        messages.warning(request, 'You are already enrolled in this course.')
-        return redirect('course_content', course_slug=course_slug)
-    
-    # Create enrollment
-    Enrollment.objects.create(
+    # Enroll, or find the existing enrollment (unique per student and course)
+    _, created = Enrollment.objects.get_or_create(
         student=request.user,
         course=course
     )
     
+    if not created:
+        messages.warning(request, 'You are already enrolled in this course.')
+        return redirect('course_content', course_slug=course_slug)
+    
     messages.success(request, f'Successfully enrolled in {course.title}!')
     return redirect('course_content', course_slug=course_slug)
 
 
 @method_decorator([login_required, student_required], name='dispatch')
-class MyResultsView(ListView):
+class MyResultsView(CursorPaginationMixin, ListView):
     """View exam results."""
     template_name = 'student/my_results.html'
     context_object_name = 'results'
     paginate_by = 20
+    # submitted_at is nullable, so page on the attempt start time
+    cursor_field = 'started_at'
     
     def get_queryset(self):
         return ExamResult.objects.filter(
             student=self.request.user
-        ).select_related('exam', 'exam__course').order_by('-submitted_at')
+        ).select_related('exam', 'exam__course').order_by('-started_at')
 
 
 @method_decorator([login_required, student_required], name='dispatch')
@@ -197,7 +221,9 @@ class TakeExamView(DetailView):
         # Get questions with answers
         context['questions'] = Question.objects.filter(
             exam=exam
-        ).prefetch_related('answers').order_by('order')
+        ).prefetch_related(
+            Prefetch('answers', queryset=Answer.objects.order_by('order'))
+        ).order_by('order')
         
         # Check previous attempts
         context['previous_attempts'] = ExamResult.objects.filter(
@@ -210,32 +236,69 @@ class TakeExamView(DetailView):
     def post(self, request, *args, **kwargs):
         exam = self.get_object()
         
-        # Check max attempts
-        attempts = ExamResult.objects.filter(
+        # Check max attempts (EXISTS is enough for single-attempt exams)
+        previous_results = ExamResult.objects.filter(
             student=request.user,
             exam=exam
-        ).count()
+        )
+        if exam.max_attempts == 1:
+            attempts = 1 if previous_results.exists() else 0
+            last_attempt = 0
+        else:
+            # Number after the highest attempt, so a deleted attempt leaves no duplicate
+            stats = previous_results.aggregate(
+                attempts=Count('id'),
+                last_attempt=Max('attempt_number')
+            )
+            attempts = stats['attempts']
+            last_attempt = stats['last_attempt'] or 0
         
         if attempts >= exam.max_attempts:
             messages.error(request, 'Maximum attempts reached for this exam.')
             return redirect('student_dashboard')
         
-        # Create exam result
-        exam_result = ExamResult.objects.create(
-            student=request.user,
-            exam=exam,
-            submitted_at=datetime.now()
-        )
-        
-        # Process answers
-        for question in exam.questions.all():
-            answer_id = request.POST.get(f'question_{question.id}')
-            if answer_id:
+        # Collect posted answers as {question_id: answer_id}
+        posted = {}
+        for key, value in request.POST.items():
+            if key.startswith('question_'):
                 try:
-                    selected_answer = Answer.objects.get(id=answer_id, question=question)
-                    exam_result.answers.add(selected_answer)
-                except Answer.DoesNotExist:
-                    pass
+                    posted[int(key[len('question_'):])] = int(value)
+                except ValueError:
+                    continue
+        
+        # Fetch all selected answers in one query, keeping only those that
+        # belong to the question they were posted for
+        selected_answers = {
+            str(answer.question_id): answer.identifier
+            for answer in Answer.objects.filter(
+                id__in=posted.values(),
+                question__exam=exam
+            ).only('id', 'question_id', 'identifier')
+            if posted.get(answer.question_id) == answer.id
+        }
+        
+        # Create exam result; a concurrent submission of the same attempt
+        # is rejected by the (exam, student, attempt_number) constraint
+        try:
+            with transaction.atomic():
+                exam_result = ExamResult.objects.create(
+                    student=request.user,
+                    exam=exam,
+                    attempt_number=last_attempt + 1,
+                    answers=selected_answers,
+                    submitted_at=timezone.now()
+                )
+                StudentAnswer.objects.bulk_create([
+                    StudentAnswer(
+                        result=exam_result,
+                        question_id=int(question_id),
+                        answer=identifier
+                    )
+                    for question_id, identifier in selected_answers.items()
+                ])
+        except IntegrityError:
+            messages.error(request, 'This attempt has already been submitted.')
+            return redirect('my_results')
         
         # Calculate result
         exam_result.calculate_result()
@@ -1,17 +1,21 @@
 """Teacher controller for teacher-specific views."""
+import json
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.utils.decorators import method_decorator
 from django.urls import reverse_lazy
-from django.db.models import Count, Avg
+from django.db import transaction
+from django.db.models import Count, Avg, Max, Q, Prefetch
 from utils.decorators import teacher_required, course_owner_required
-from models.course_model import Course, Category
-from models.content_model import Content, Video, Document
+from utils.cache import get_categories
+from utils.pagination import CursorPaginationMixin
+from models.course_model import Course
+from models.content_model import Content, Video, Document, update_mandatory_content_count
 from models.exam_model import Exam, ExamResult
 from models.question_model import Question, Answer
-from models.enrollment_model import Enrollment
+from models.enrollment_model import Enrollment, recompute_course_progress
 from models.user_model import User
 
 
@@ -24,31 +28,29 @@ class TeacherDashboardView(ListView):
     def get_queryset(self):
         return Course.objects.filter(
             teacher=self.request.user
-        ).annotate(
+        ).select_related('category').annotate(
             student_count=Count('enrollments')
-        ).order_by('-created_at')[:6]
+        ).with_enrolled_count().order_by('-created_at')[:6]
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         teacher = self.request.user
         
         # Statistics
-        context['total_courses'] = Course.objects.filter(teacher=teacher).count()
+        course_stats = Course.objects.filter(teacher=teacher).aggregate(
+            total=Count('id'),
+            published=Count('id', filter=Q(status='PUBLISHED')),
+            avg_rating=Avg('rating'),
+        )
+        context['total_courses'] = course_stats['total']
+        context['published_courses'] = course_stats['published']
         context['total_students'] = Enrollment.objects.filter(
             course__teacher=teacher
-        ).values('student').distinct().count()
-        context['published_courses'] = Course.objects.filter(
-            teacher=teacher, 
-            status='PUBLISHED'
-        ).count()
+        ).aggregate(students=Count('student', distinct=True))['students']
         
-        # Average rating
-        courses = Course.objects.filter(teacher=teacher)
-        if courses.exists():
-            avg_rating = courses.aggregate(Avg('rating'))['rating__avg']
-            context['avg_rating'] = round(avg_rating, 1) if avg_rating else 0
-        else:
-            context['avg_rating'] = 0
+        # Average rating (None when the teacher has no courses)
+        avg_rating = course_stats['avg_rating']
+        context['avg_rating'] = round(avg_rating, 1) if avg_rating else 0
         
         return context
 
@@ -63,9 +65,9 @@ class MyCoursesView(ListView):
     def get_queryset(self):
         return Course.objects.filter(
             teacher=self.request.user
-        ).annotate(
+        ).select_related('category').for_listing().annotate(
             student_count=Count('enrollments')
-        ).order_by('-created_at')
+        ).with_enrolled_count().order_by('-created_at')
 
 
 @method_decorator([login_required, teacher_required], name='dispatch')
@@ -74,7 +76,7 @@ class CreateCourseView(CreateView):
     model = Course
     template_name = 'teacher/create_course.html'
     fields = ['title', 'description', 'category', 'thumbnail', 'level', 
-              'language', 'price', 'requirements', 'what_you_will_learn', 
+              'price', 'prerequisites', 'learning_objectives', 
               'is_featured']
     success_url = reverse_lazy('my_courses')
     
@@ -86,7 +88,7 @@ class CreateCourseView(CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = Category.objects.all()
+        context['categories'] = get_categories()
         return context
 
 
@@ -96,10 +98,20 @@ class EditCourseView(UpdateView):
     model = Course
     template_name = 'teacher/edit_course.html'
     fields = ['title', 'description', 'category', 'thumbnail', 'level', 
-              'language', 'price', 'requirements', 'what_you_will_learn', 
+              'price', 'prerequisites', 'learning_objectives', 
               'is_featured', 'status']
     slug_url_kwarg = 'course_slug'
     
+    def get_queryset(self):
+        return Course.objects.filter(
+            teacher=self.request.user
+        ).prefetch_related(
+            Prefetch(
+                'contents',
+                queryset=Content.objects.select_related('video', 'document').order_by('order')
+            )
+        )
+    
     def get_success_url(self):
         return reverse_lazy('edit_course', kwargs={'course_slug': self.object.slug})
     
@@ -109,10 +121,8 @@ class EditCourseView(UpdateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = Category.objects.all()
-        context['contents'] = Content.objects.filter(
-            course=self.object
-        ).order_by('order')
+        context['categories'] = get_categories()
+        context['contents'] = self.object.contents.all()
         return context
 
 
@@ -132,11 +142,12 @@ def delete_course(request, course_slug):
 
 
 @method_decorator([login_required, teacher_required], name='dispatch')
-class StudentsListView(ListView):
+class StudentsListView(CursorPaginationMixin, ListView):
     """View all enrolled students."""
     template_name = 'teacher/students_list.html'
     context_object_name = 'enrollments'
     paginate_by = 20
+    cursor_field = 'enrolled_at'
     
     def get_queryset(self):
         course_slug = self.kwargs.get('course_slug')
@@ -144,11 +155,11 @@ class StudentsListView(ListView):
             return Enrollment.objects.filter(
                 course__slug=course_slug,
                 course__teacher=self.request.user
-            ).select_related('student', 'course').order_by('-enrolled_at')
+            ).select_related('student', 'course', 'course__teacher').order_by('-enrolled_at')
         else:
             return Enrollment.objects.filter(
                 course__teacher=self.request.user
-            ).select_related('student', 'course').order_by('-enrolled_at')
+            ).select_related('student', 'course', 'course__teacher').order_by('-enrolled_at')
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -197,45 +208,124 @@ def add_content(request, course_slug):
         title = request.POST.get('title')
         description = request.POST.get('description', '')
         
-        # Get the next order number
-        max_order = Content.objects.filter(course=course).count()
-        
-        if content_type == 'VIDEO':
-            video_file = request.FILES.get('video_file')
-            video_url = request.POST.get('video_url', '')
-            duration = request.POST.get('duration', 0)
+        with transaction.atomic():
+            # Lock the course row so concurrent uploads get distinct order numbers
+            Course.objects.select_for_update().only('id').get(pk=course.pk)
             
-            Video.objects.create(
-                course=course,
-                title=title,
-                description=description,
-                content_type='VIDEO',
-                order=max_order + 1,
-                video_file=video_file,
-                video_url=video_url,
-                duration=duration
-            )
-        elif content_type == 'DOCUMENT':
-            document_file = request.FILES.get('document_file')
+            # Get the next order number
+            max_order = Content.objects.filter(
+                course=course
+            ).aggregate(max_order=Max('order'))['max_order'] or 0
             
-            Document.objects.create(
-                course=course,
-                title=title,
-                description=description,
-                content_type='DOCUMENT',
-                order=max_order + 1,
-                document_file=document_file
-            )
-        else:
-            Content.objects.create(
+            content = Content.objects.create(
                 course=course,
                 title=title,
                 description=description,
                 content_type=content_type,
-                order=max_order + 1
+                order=max_order + 1,
+                duration_minutes=request.POST.get('duration', 0) or 0
             )
+            
+            if content_type == 'VIDEO':
+                Video.objects.create(
+                    content=content,
+                    video_file=request.FILES.get('video_file'),
+                    video_url=request.POST.get('video_url', '')
+                )
+            elif content_type == 'DOCUMENT':
+                Document.objects.create(
+                    content=content,
+                    file=request.FILES.get('document_file')
+                )
         
         messages.success(request, 'Content added successfully!')
         return redirect('edit_course', course_slug=course_slug)
     
     return render(request, 'teacher/add_content.html', {'course': course})
+
+
+@login_required
+@teacher_required
+def bulk_add_content(request, course_slug):
+    """Add several contents to a course in one request."""
+    course = get_object_or_404(Course, slug=course_slug, teacher=request.user)
+    
+    if request.method != 'POST':
+        return redirect('edit_course', course_slug=course_slug)
+    
+    # Each item is a JSON object: title, content_type and optional description,
+    # duration, video_url and file (name of the uploaded file field, for videos and documents)
+    items = []
+    for raw_item in request.POST.getlist('items'):
+        try:
+            item = json.loads(raw_item)
+        except ValueError:
+            item = None
+        
+        if (not isinstance(item, dict) or not item.get('title')
+                or item.get('content_type') not in Content.ContentType.values):
+            messages.error(request, 'Each content needs a title and a valid content type.')
+            return redirect('edit_course', course_slug=course_slug)
+        
+        if item['content_type'] == 'DOCUMENT' and not request.FILES.get(item.get('file', '')):
+            messages.error(request, f'Document "{item["title"]}" has no file.')
+            return redirect('edit_course', course_slug=course_slug)
+        
+        if item['content_type'] == 'VIDEO' and item.get('file') and item['file'] not in request.FILES:
+            messages.error(request, f'Video "{item["title"]}" refers to a missing file.')
+            return redirect('edit_course', course_slug=course_slug)
+        
+        try:
+            item['duration'] = int(item.get('duration') or 0)
+        except (TypeError, ValueError):
+            messages.error(request, f'Content "{item["title"]}" has an invalid duration.')
+            return redirect('edit_course', course_slug=course_slug)
+        
+        items.append(item)
+    
+    if not items:
+        messages.error(request, 'No content to add.')
+        return redirect('edit_course', course_slug=course_slug)
+    
+    with transaction.atomic():
+        # Lock the course row so concurrent uploads get distinct order numbers
+        Course.objects.select_for_update().only('id').get(pk=course.pk)
+        
+        max_order = Content.objects.filter(
+            course=course
+        ).aggregate(max_order=Max('order'))['max_order'] or 0
+        
+        contents = Content.objects.bulk_create([
+            Content(
+                course=course,
+                title=item['title'],
+                description=item.get('description', ''),
+                content_type=item['content_type'],
+                order=max_order + i,
+                duration_minutes=item['duration']
+            )
+            for i, item in enumerate(items, start=1)
+        ])
+        
+        # bulk_create sets primary keys on PostgreSQL and SQLite
+        Video.objects.bulk_create([
+            Video(
+                content=content,
+                video_file=request.FILES.get(item.get('file', '')),
+                video_url=item.get('video_url', '')
+            )
+            for content, item in zip(contents, items)
+            if item['content_type'] == 'VIDEO'
+        ])
+        Document.objects.bulk_create([
+            Document(content=content, file=request.FILES[item['file']])
+            for content, item in zip(contents, items)
+            if item['content_type'] == 'DOCUMENT'
+        ])
+        
+        # bulk_create skips the post_save signal that maintains these
+        update_mandatory_content_count(course.pk)
+        recompute_course_progress(course.pk)
+    
+    messages.success(request, f'{len(contents)} contents added successfully!')
+    return redirect('edit_course', course_slug=course_slug)
@@ -18,4 +18,5 @@ class ModelsConfig(AppConfig):
         from . import question_model
         from . import enrollment_model
         from . import progress_model
+        from . import signals
 
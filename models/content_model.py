@@ -1,5 +1,7 @@
 """Content models for course materials."""
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.core.validators import FileExtensionValidator
 from .course_model import Course
 
@@ -75,6 +77,13 @@ class Content(models.Model):
     
     def __str__(self):
         return f"{self.course.title} - {self.title}"
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored flag so signals can tell when the mandatory count changes
+        instance._loaded_is_mandatory = instance.__dict__.get('is_mandatory')
+        return instance
 
 
 class Video(models.Model):
@@ -169,3 +178,19 @@ class Document(models.Model):
     def __str__(self):
         return f"Document: {self.content.title}"
 
+
+def update_mandatory_content_count(course_id):
+    """Recount a course's mandatory contents into Course.mandatory_content_count."""
+    Course.objects.filter(pk=course_id).update(
+        mandatory_content_count=Coalesce(
+            Subquery(
+                Content.objects.filter(
+                    course=OuterRef('pk'),
+                    is_mandatory=True
+                ).order_by().values('course').annotate(
+                    count=Count('id')
+                ).values('count')
+            ),
+            0
+        )
+    )
@@ -1,6 +1,8 @@
 """Course and Category models."""
-from django.db import models
+from django.db import models, connections
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
 from django.core.validators import FileExtensionValidator, MinValueValidator, MaxValueValidator
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from django.conf import settings
 
@@ -50,6 +52,52 @@ class Category(models.Model):
         super().save(*args, **kwargs)
 
 
+# Course columns not needed to render course lists
+LISTING_DEFERRED_FIELDS = ('description', 'prerequisites', 'learning_objectives', 'search_vector')
+
+
+class CourseQuerySet(models.QuerySet):
+    """Custom queryset for Course model."""
+    
+    def with_stats(self):
+        """Annotate enrollment count and average enrollment rating."""
+        return self.annotate(
+            enrollment_count=models.Count('enrollments', distinct=True),
+            avg_rating=models.Avg('enrollments__rating')
+        )
+    
+    def with_enrolled_count(self):
+        """Annotate active enrollment count (read by Course.enrolled_count)."""
+        return self.annotate(
+            active_enrolled=models.Count(
+                'enrollments',
+                filter=models.Q(enrollments__is_active=True),
+                distinct=True
+            )
+        )
+    
+    def for_listing(self):
+        """Defer long text and the search document, which course cards never show."""
+        return self.defer(*LISTING_DEFERRED_FIELDS)
+    
+    def search(self, term):
+        """Filter by title/description, ranked full-text search on PostgreSQL (newest first otherwise)."""
+        if connections[self.db].vendor == 'postgresql':
+            query = SearchQuery(term)
+            return self.filter(search_vector=query).annotate(
+                rank=SearchRank(models.F('search_vector'), query)
+            ).order_by('-rank', '-created_at')
+        return self.filter(
+            models.Q(title__icontains=term) |
+            models.Q(description__icontains=term)
+        ).order_by('-created_at')
+
+
+def course_search_vector():
+    """Weighted search document for a course (title ranks above description)."""
+    return SearchVector('title', weight='A') + SearchVector('description', weight='B')
+
+
 class Course(models.Model):
     """Course model."""
     
@@ -164,10 +212,26 @@ class Course(models.Model):
         help_text='Total number of ratings'
     )
     
+    # Maintained from Content changes (see content_model.update_mandatory_content_count)
+    mandatory_content_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text='Number of mandatory content items'
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(blank=True, null=True)
     
+    # Maintained on PostgreSQL only (see models.signals), GIN-indexed by migration
+    search_vector = SearchVectorField(
+        blank=True,
+        null=True,
+        editable=False
+    )
+    
+    objects = CourseQuerySet.as_manager()
+    
     class Meta:
         db_table = 'courses'
         verbose_name = 'Course'
@@ -176,6 +240,9 @@ class Course(models.Model):
         indexes = [
             models.Index(fields=['status', '-created_at']),
             models.Index(fields=['teacher', 'status']),
+            models.Index(fields=['teacher', '-created_at']),
+            models.Index(fields=['category', 'status']),
+            models.Index(fields=['is_featured', 'status']),
         ]
     
     def __str__(self):
@@ -196,12 +263,15 @@ class Course(models.Model):
         """Check if course is free."""
         return self.price == 0
     
-    @property
+    @cached_property
     def enrolled_count(self):
         """Get number of enrolled students."""
+        active_enrolled = getattr(self, 'active_enrolled', None)
+        if active_enrolled is not None:
+            return active_enrolled
         return self.enrollments.filter(is_active=True).count()
     
-    @property
+    @cached_property
     def is_full(self):
         """Check if course has reached maximum capacity."""
         if self.max_students:
@@ -1,8 +1,78 @@
 """Enrollment and Certificate models."""
-from django.db import models
+import secrets
+from decimal import Decimal
+from django.db import connections, models, transaction
 from django.conf import settings
+from django.utils import timezone
 from django.core.validators import FileExtensionValidator
 from .course_model import Course
+from .content_model import Content
+from .exam_model import Exam, ExamResult
+
+
+# Enrollment.update_progress as one statement (PostgreSQL only, see EnrollmentQuerySet.recompute)
+RECOMPUTE_PROGRESS_SQL = """
+WITH target AS (
+    SELECT e.student_id, e.course_id, e.status, c.mandatory_content_count AS total
+    FROM enrollments e
+    JOIN courses c ON c.id = e.course_id
+    WHERE e.id = %(pk)s
+), done AS (
+    SELECT COUNT(*) AS completed
+    FROM content_progress cp
+    JOIN contents ct ON ct.id = cp.content_id
+    JOIN progress p ON p.id = cp.progress_id
+    JOIN target t ON ct.course_id = t.course_id AND p.student_id = t.student_id
+    WHERE ct.is_mandatory AND cp.is_completed
+), pct AS (
+    SELECT CASE WHEN t.total = 0 THEN 100
+                ELSE ROUND(LEAST(d.completed, t.total) * 100.0 / t.total, 2)
+           END AS value
+    FROM target t, done d
+), gate AS (
+    SELECT NOT EXISTS (
+        SELECT 1
+        FROM exams x
+        JOIN target t ON x.course_id = t.course_id
+        WHERE x.is_required AND NOT EXISTS (
+            SELECT 1 FROM exam_results r
+            WHERE r.exam_id = x.id AND r.student_id = t.student_id AND r.is_passed
+        )
+    ) AS all_passed
+), flag AS (
+    SELECT pct.value = 100 AND gate.all_passed AND t.status = %(active)s AS done_now
+    FROM target t, pct, gate
+)
+UPDATE enrollments e SET
+    progress_percentage = pct.value,
+    status = CASE WHEN flag.done_now THEN %(completed)s ELSE e.status END,
+    completed_at = CASE WHEN flag.done_now THEN NOW() ELSE e.completed_at END,
+    last_accessed_at = NOW()
+FROM pct, flag
+WHERE e.id = %(pk)s
+"""
+
+
+class EnrollmentQuerySet(models.QuerySet):
+    """Custom queryset for Enrollment model."""
+    
+    def recompute(self):
+        """Recompute progress for these enrollments; one UPDATE each on PostgreSQL."""
+        connection = connections[self.db]
+        if connection.vendor != 'postgresql':
+            for enrollment in self.select_related('course'):
+                enrollment.update_progress()
+            return
+        
+        with transaction.atomic(using=self.db), connection.cursor() as cursor:
+            # Lock the rows first: each UPDATE then starts after any concurrent
+            # recompute commits, so its snapshot counts that worker's completions too
+            for pk in list(self.select_for_update().values_list('id', flat=True)):
+                cursor.execute(RECOMPUTE_PROGRESS_SQL, {
+                    'pk': pk,
+                    'active': Enrollment.Status.ACTIVE,
+                    'completed': Enrollment.Status.COMPLETED,
+                })
 
 
 class Enrollment(models.Model):
@@ -96,6 +166,8 @@ class Enrollment(models.Model):
         help_text='Review submission date'
     )
     
+    objects = EnrollmentQuerySet.as_manager()
+    
     class Meta:
         db_table = 'enrollments'
         verbose_name = 'Enrollment'
@@ -105,6 +177,10 @@ class Enrollment(models.Model):
         indexes = [
             models.Index(fields=['student', 'status']),
             models.Index(fields=['course', 'status']),
+            models.Index(fields=['-enrolled_at']),
+            models.Index(fields=['student', '-enrolled_at', '-id']),
+            models.Index(fields=['course', '-enrolled_at', '-id']),
+            models.Index(fields=['student', 'is_active', '-enrolled_at'], name='enr_student_active_recent'),
         ]
     
     def __str__(self):
@@ -112,47 +188,113 @@ class Enrollment(models.Model):
     
     def mark_completed(self):
         """Mark enrollment as completed."""
-        from django.utils import timezone
         self.status = self.Status.COMPLETED
         self.completed_at = timezone.now()
         self.progress_percentage = 100.00
-        self.save()
+        self.save(update_fields=['status', 'completed_at', 'progress_percentage', 'last_accessed_at'])
     
     def update_progress(self):
         """Calculate and update course progress."""
-        from .progress_model import Progress
-        
-        # Get or create progress
-        progress_obj, _ = Progress.objects.get_or_create(
-            student=self.student,
-            course=self.course
-        )
-        
-        total_contents = self.course.contents.filter(is_mandatory=True).count()
+        with transaction.atomic():
+            # The mandatory total is kept on the course (see Course.mandatory_content_count)
+            total_contents = self.course.mandatory_content_count
+            if total_contents == 0:
+                percentage = Decimal('100.00')
+            else:
+                completed_contents = Content.objects.filter(
+                    course_id=self.course_id,
+                    is_mandatory=True,
+                    student_progress__progress__student_id=self.student_id,
+                    student_progress__is_completed=True
+                ).count()
+                percentage = (Decimal(min(completed_contents, total_contents) * 100) / total_contents).quantize(Decimal('0.01'))
+            
+            # Only a full, still-active enrollment needs the exam gate
+            unchanged = percentage == self.progress_percentage
+            can_complete = percentage == 100 and self.status == self.Status.ACTIVE
+            if unchanged and not can_complete:
+                return
+            self.progress_percentage = percentage
+            
+            # Check if all required exams are passed
+            if can_complete:
+                has_unpassed_exam = Exam.objects.filter(
+                    course_id=self.course_id,
+                    is_required=True
+                ).exclude(
+                    models.Exists(ExamResult.objects.filter(
+                        exam=models.OuterRef('pk'),
+                        student_id=self.student_id,
+                        is_passed=True
+                    ))
+                ).exists()
+                
+                if not has_unpassed_exam:
+                    # mark_completed() saves the percentage along with the status
+                    self.mark_completed()
+                    return
+                
+                if unchanged:
+                    return
+            
+            self.save(update_fields=['progress_percentage', 'last_accessed_at'])
+
+
+def recompute_course_progress(course_id):
+    """Recompute every enrollment's progress for a course with a few set-based queries."""
+    total_contents = Course.objects.filter(pk=course_id).values_list(
+        'mandatory_content_count', flat=True
+    ).first() or 0
+    required_exams = Exam.objects.filter(course_id=course_id, is_required=True).count()
+    
+    completed_by_student = dict(
+        Content.objects.filter(
+            course_id=course_id,
+            is_mandatory=True,
+            student_progress__is_completed=True
+        ).order_by().values('student_progress__progress__student_id').annotate(
+            count=models.Count('id')
+        ).values_list('student_progress__progress__student_id', 'count')
+    )
+    passed_by_student = dict(
+        ExamResult.objects.filter(
+            exam__course_id=course_id,
+            exam__is_required=True,
+            is_passed=True
+        ).order_by().values('student_id').annotate(
+            count=models.Count('exam', distinct=True)
+        ).values_list('student_id', 'count')
+    )
+    
+    now = timezone.now()
+    changed = []
+    for enrollment in Enrollment.objects.filter(course_id=course_id).only(
+        'id', 'student_id', 'status', 'completed_at', 'progress_percentage'
+    ):
         if total_contents == 0:
-            self.progress_percentage = 100.00
+            percentage = Decimal('100.00')
         else:
-            completed_contents = progress_obj.content_progress.filter(
-                content__is_mandatory=True,
-                is_completed=True
-            ).count()
-            self.progress_percentage = (completed_contents / total_contents) * 100
+            completed = completed_by_student.get(enrollment.student_id, 0)
+            percentage = (Decimal(min(completed, total_contents) * 100) / total_contents).quantize(Decimal('0.01'))
         
-        # Check if all required exams are passed
-        if self.progress_percentage == 100.00:
-            required_exams = self.course.exams.filter(is_required=True)
-            all_exams_passed = all(
-                self.student.exam_results.filter(
-                    exam=exam,
-                    is_passed=True
-                ).exists()
-                for exam in required_exams
-            )
-            
-            if all_exams_passed and self.status == self.Status.ACTIVE:
-                self.mark_completed()
+        updated = percentage != enrollment.progress_percentage
+        enrollment.progress_percentage = percentage
+        
+        if (percentage == 100 and enrollment.status == Enrollment.Status.ACTIVE
+                and passed_by_student.get(enrollment.student_id, 0) >= required_exams):
+            enrollment.status = Enrollment.Status.COMPLETED
+            enrollment.completed_at = now
+            updated = True
         
-        self.save()
+        if updated:
+            changed.append(enrollment)
+    
+    Enrollment.objects.bulk_update(
+        changed,
+        ['progress_percentage', 'status', 'completed_at'],
+        batch_size=1000
+    )
+    return len(changed)
 
 
 class Certificate(models.Model):
@@ -205,20 +347,17 @@ class Certificate(models.Model):
         return f"Certificate {self.certificate_number} for {self.enrollment.student.username}"
     
     def save(self, *args, **kwargs):
-        if not self.certificate_number:
-            # Generate certificate number
-            import uuid
-            from django.utils import timezone
-            date_str = timezone.now().strftime('%Y%m%d')
-            unique_id = str(uuid.uuid4())[:8].upper()
-            self.certificate_number = f"CERT-{date_str}-{unique_id}"
-        
-        if not self.verification_code:
-            # Generate verification code
-            import hashlib
-            import uuid
-            code = hashlib.sha256(str(uuid.uuid4()).encode()).hexdigest()[:20].upper()
-            self.verification_code = code
+        if not (self.certificate_number and self.verification_code):
+            # One random draw: 8 hex characters for the number, the other 20 for the code
+            token = secrets.token_hex(14).upper()
+            
+            if not self.certificate_number:
+                # Generate certificate number
+                self.certificate_number = f"CERT-{timezone.now():%Y%m%d}-{token[:8]}"
+            
+            if not self.verification_code:
+                # Generate verification code (20 random hex characters)
+                self.verification_code = token[8:]
         
         super().save(*args, **kwargs)
 
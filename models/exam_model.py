@@ -1,8 +1,13 @@
 """Exam and ExamResult models."""
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
 from .course_model import Course
+from .question_model import Question, StudentAnswer
 
 
 class Exam(models.Model):
@@ -89,6 +94,13 @@ class Exam(models.Model):
         help_text='Exam availability end date'
     )
     
+    # Maintained from Question changes (see update_question_count)
+    cached_question_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text='Number of questions in the exam'
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -104,7 +116,7 @@ class Exam(models.Model):
     def __str__(self):
         return f"{self.course.title} - {self.title}"
     
-    @property
+    @cached_property
     def passing_percentage(self):
         """Calculate passing percentage."""
         if self.total_marks > 0:
@@ -113,12 +125,11 @@ class Exam(models.Model):
     
     @property
     def question_count(self):
-        """Get total number of questions."""
-        return self.questions.count()
+        """Get total number of questions (kept in cached_question_count)."""
+        return self.cached_question_count
     
     def is_available(self):
         """Check if exam is currently available."""
-        from django.utils import timezone
         now = timezone.now()
         
         if not self.is_published:
@@ -215,8 +226,11 @@ class ExamResult(models.Model):
         ordering = ['-started_at']
         unique_together = [['exam', 'student', 'attempt_number']]
         indexes = [
-            models.Index(fields=['student', '-started_at']),
+            models.Index(fields=['student', '-started_at', '-id']),
+            models.Index(fields=['student', '-submitted_at']),
             models.Index(fields=['exam', 'student']),
+            models.Index(fields=['student', 'exam', 'is_passed']),
+            models.Index(fields=['-started_at']),
         ]
     
     def __str__(self):
@@ -224,26 +238,50 @@ class ExamResult(models.Model):
     
     def calculate_result(self):
         """Calculate exam score and percentage."""
-        total_questions = self.exam.questions.count()
+        exam = self.exam
+        
+        # Count questions and correct answers in one query
+        stats = exam.questions.aggregate(
+            total=models.Count('id'),
+            correct=models.Count('id', filter=models.Exists(
+                StudentAnswer.objects.filter(
+                    result_id=self.pk,
+                    question=models.OuterRef('pk'),
+                    answer=models.OuterRef('correct_answer')
+                )
+            ))
+        )
+        total_questions = stats['total']
         if total_questions == 0:
             return
         
-        correct_answers = 0
-        for question in self.exam.questions.all():
-            student_answer = self.answers.get(str(question.id))
-            if student_answer == question.correct_answer:
-                correct_answers += 1
-        
         # Calculate score
-        marks_per_question = self.exam.total_marks / total_questions
-        self.score = correct_answers * marks_per_question
+        total_marks = exam.total_marks
+        marks_per_question = total_marks / total_questions
+        self.score = stats['correct'] * marks_per_question
         
         # Calculate percentage
-        self.percentage = (self.score / self.exam.total_marks) * 100
+        self.percentage = (self.score / total_marks) * 100
         
         # Check if passed
-        self.is_passed = self.score >= self.exam.passing_marks
+        self.is_passed = self.score >= exam.passing_marks
         
         self.status = self.Status.GRADED
-        self.save()
+        self.graded_at = timezone.now()
+        self.save(update_fields=['score', 'percentage', 'is_passed', 'status', 'graded_at'])
 
+
+def update_question_count(exam_id):
+    """Recount an exam's questions into Exam.cached_question_count."""
+    Exam.objects.filter(pk=exam_id).update(
+        cached_question_count=Coalesce(
+            Subquery(
+                Question.objects.filter(
+                    exam=OuterRef('pk')
+                ).order_by().values('exam').annotate(
+                    count=Count('id')
+                ).values('count')
+            ),
+            0
+        )
+    )
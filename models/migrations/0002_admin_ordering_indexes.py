@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['-enrolled_at'], name='enrollments_enrolle_10fea5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='examresult',
+            index=models.Index(fields=['-started_at'], name='exam_result_started_de7bf8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(fields=['-last_accessed_at'], name='progress_last_ac_3af8a4_idx'),
+        ),
+    ]
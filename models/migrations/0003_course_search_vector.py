@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-15 19:57
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """Build the GIN index and backfill search vectors (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX courses_search_vector_gin ON courses USING gin (search_vector)'
+    )
+    Course = apps.get_model('models', 'Course')
+    Course.objects.using(schema_editor.connection.alias).update(
+        search_vector=SearchVector('title', weight='A') + SearchVector('description', weight='B')
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS courses_search_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0002_admin_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# Django's icontains compiles to UPPER(col::text) LIKE UPPER(%s) on
+# PostgreSQL, so trigram indexes on UPPER(col) serve substring searches.
+USER_SEARCH_COLUMNS = ['username', 'email', 'first_name', 'last_name']
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create pg_trgm indexes for user search (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in USER_SEARCH_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX users_{column}_trgm ON users USING gin (UPPER({column}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in USER_SEARCH_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS users_{column}_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0004_admin_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0005_user_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='examresult',
+            name='exam_result_student_3b2f98_idx',
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['student', '-enrolled_at', '-id'], name='enrollments_student_ea8d58_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['course', '-enrolled_at', '-id'], name='enrollments_course__9e84aa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='examresult',
+            index=models.Index(fields=['student', '-started_at', '-id'], name='exam_result_student_c0c0bb_idx'),
+        ),
+    ]
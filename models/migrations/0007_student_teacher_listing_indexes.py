@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0006_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['teacher', '-created_at'], name='courses_teacher_a8ec22_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='examresult',
+            index=models.Index(fields=['student', '-submitted_at'], name='exam_result_student_5fbd38_idx'),
+        ),
+    ]
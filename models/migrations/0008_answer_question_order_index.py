@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0007_student_teacher_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'order'], name='answers_questio_9ed041_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:12
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_mandatory_content_count(apps, schema_editor):
+    Course = apps.get_model('models', 'Course')
+    Content = apps.get_model('models', 'Content')
+    Course.objects.using(schema_editor.connection.alias).update(
+        mandatory_content_count=Coalesce(
+            Subquery(
+                Content.objects.filter(
+                    course=OuterRef('pk'),
+                    is_mandatory=True
+                ).order_by().values('course').annotate(
+                    count=Count('id')
+                ).values('count')
+            ),
+            0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0008_answer_question_order_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='mandatory_content_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of mandatory content items'),
+        ),
+        migrations.RunPython(backfill_mandatory_content_count, migrations.RunPython.noop),
+    ]
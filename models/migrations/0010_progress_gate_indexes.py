@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0009_course_mandatory_content_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contentprogress',
+            index=models.Index(fields=['progress', 'is_completed'], name='content_pro_progres_e2be7c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='examresult',
+            index=models.Index(fields=['student', 'exam', 'is_passed'], name='exam_result_student_8bc067_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_json_answers(apps, schema_editor):
+    """Create StudentAnswer rows from the answers stored on existing results."""
+    ExamResult = apps.get_model('models', 'ExamResult')
+    Question = apps.get_model('models', 'Question')
+    StudentAnswer = apps.get_model('models', 'StudentAnswer')
+    db_alias = schema_editor.connection.alias
+    
+    question_ids = set(Question.objects.using(db_alias).values_list('id', flat=True))
+    rows = []
+    for result_id, answers in ExamResult.objects.using(db_alias).values_list('id', 'answers').iterator():
+        for question_id, answer in (answers or {}).items():
+            if str(question_id).isdigit() and int(question_id) in question_ids and answer:
+                rows.append(StudentAnswer(
+                    result_id=result_id,
+                    question_id=int(question_id),
+                    answer=str(answer)[:10]
+                ))
+    StudentAnswer.objects.using(db_alias).bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0010_progress_gate_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentAnswer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('answer', models.CharField(help_text='Selected answer identifier', max_length=10)),
+                ('question', models.ForeignKey(help_text='Answered question', on_delete=django.db.models.deletion.CASCADE, related_name='student_answers', to='models.question')),
+                ('result', models.ForeignKey(help_text='Exam attempt', on_delete=django.db.models.deletion.CASCADE, related_name='student_answers', to='models.examresult')),
+            ],
+            options={
+                'verbose_name': 'Student Answer',
+                'verbose_name_plural': 'Student Answers',
+                'db_table': 'student_answers',
+                'unique_together': {('result', 'question')},
+            },
+        ),
+        migrations.RunPython(copy_json_answers, migrations.RunPython.noop),
+    ]
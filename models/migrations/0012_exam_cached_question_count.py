@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:14
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_question_count(apps, schema_editor):
+    Exam = apps.get_model('models', 'Exam')
+    Question = apps.get_model('models', 'Question')
+    Exam.objects.using(schema_editor.connection.alias).update(
+        cached_question_count=Coalesce(
+            Subquery(
+                Question.objects.filter(
+                    exam=OuterRef('pk')
+                ).order_by().values('exam').annotate(
+                    count=Count('id')
+                ).values('count')
+            ),
+            0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0011_student_answers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exam',
+            name='cached_question_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of questions in the exam'),
+        ),
+        migrations.RunPython(backfill_question_count, migrations.RunPython.noop),
+    ]
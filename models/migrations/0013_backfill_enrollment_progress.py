@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:16
+
+from django.db import migrations
+from django.db.models import Exists, OuterRef
+
+
+def backfill_enrollment_progress(apps, schema_editor):
+    Enrollment = apps.get_model('models', 'Enrollment')
+    Progress = apps.get_model('models', 'Progress')
+    db_alias = schema_editor.connection.alias
+    missing = Enrollment.objects.using(db_alias).exclude(
+        Exists(Progress.objects.filter(
+            student_id=OuterRef('student_id'),
+            course_id=OuterRef('course_id')
+        ))
+    ).values_list('student_id', 'course_id')
+    Progress.objects.using(db_alias).bulk_create(
+        [Progress(student_id=student_id, course_id=course_id) for student_id, course_id in missing],
+        batch_size=1000,
+        ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0012_exam_cached_question_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_enrollment_progress, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0013_backfill_enrollment_progress'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['student', 'is_active', '-enrolled_at'], name='enr_student_active_recent'),
+        ),
+    ]
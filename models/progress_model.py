@@ -1,8 +1,10 @@
 """Progress tracking models."""
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from .course_model import Course
 from .content_model import Content
+from .enrollment_model import Enrollment
 
 
 class Progress(models.Model):
@@ -53,6 +55,9 @@ class Progress(models.Model):
         verbose_name_plural = 'Progress'
         unique_together = [['student', 'course']]
         ordering = ['-last_accessed_at']
+        indexes = [
+            models.Index(fields=['-last_accessed_at']),
+        ]
     
     def __str__(self):
         return f"{self.student.username} - {self.course.title} progress"
@@ -126,24 +131,22 @@ class ContentProgress(models.Model):
         verbose_name_plural = 'Content Progress'
         unique_together = [['progress', 'content']]
         ordering = ['content__order']
+        indexes = [
+            models.Index(fields=['progress', 'is_completed']),
+        ]
     
     def __str__(self):
         return f"{self.progress.student.username} - {self.content.title}"
     
     def mark_completed(self):
         """Mark content as completed."""
-        from django.utils import timezone
-        from .enrollment_model import Enrollment
-        
         self.is_completed = True
         self.completed_at = timezone.now()
-        self.save()
+        self.save(update_fields=['is_completed', 'completed_at', 'last_accessed_at'])
         
         # Update enrollment progress
-        enrollment = Enrollment.objects.filter(
-            student=self.progress.student,
-            course=self.progress.course
-        ).first()
-        if enrollment:
-            enrollment.update_progress()
+        Enrollment.objects.filter(
+            student_id=self.progress.student_id,
+            course_id=self.progress.course_id
+        ).recompute()
 
@@ -1,6 +1,5 @@
 """Question and Answer models for exams."""
 from django.db import models
-from .exam_model import Exam
 
 
 class Question(models.Model):
@@ -13,7 +12,7 @@ class Question(models.Model):
         ESSAY = 'ESSAY', 'Essay'
     
     exam = models.ForeignKey(
-        Exam,
+        'Exam',
         on_delete=models.CASCADE,
         related_name='questions',
         help_text='Associated exam'
@@ -110,7 +109,42 @@ class Answer(models.Model):
         verbose_name = 'Answer'
         verbose_name_plural = 'Answers'
         ordering = ['question', 'order']
+        indexes = [
+            models.Index(fields=['question', 'order']),
+        ]
     
     def __str__(self):
         return f"{self.question} - {self.identifier}: {self.answer_text[:30]}"
 
+
+class StudentAnswer(models.Model):
+    """Answer a student selected for a question in an exam attempt."""
+    
+    result = models.ForeignKey(
+        'ExamResult',
+        on_delete=models.CASCADE,
+        related_name='student_answers',
+        help_text='Exam attempt'
+    )
+    
+    question = models.ForeignKey(
+        Question,
+        on_delete=models.CASCADE,
+        related_name='student_answers',
+        help_text='Answered question'
+    )
+    
+    answer = models.CharField(
+        max_length=10,
+        help_text='Selected answer identifier'
+    )
+    
+    class Meta:
+        db_table = 'student_answers'
+        verbose_name = 'Student Answer'
+        verbose_name_plural = 'Student Answers'
+        unique_together = [['result', 'question']]
+    
+    def __str__(self):
+        return f"Result {self.result_id} - Q{self.question_id}: {self.answer}"
+
@@ -0,0 +1,95 @@
+"""Signal handlers for keeping derived model data in sync."""
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from utils.cache import CATEGORIES_CACHE_KEY, HOME_STATS_CACHE_KEY
+from .content_model import Content, update_mandatory_content_count
+from .course_model import Category, Course, course_search_vector
+from .enrollment_model import Enrollment, recompute_course_progress
+from .exam_model import update_question_count
+from .progress_model import Progress
+from .question_model import Question
+from .user_model import User
+
+
+@receiver(post_save, sender=Course)
+def update_course_search_vector(sender, instance, using, **kwargs):
+    """Refresh the full-text search document after a course is saved."""
+    if connections[using].vendor != 'postgresql':
+        return
+    Course.objects.using(using).filter(pk=instance.pk).update(
+        search_vector=course_search_vector()
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_home_stats(sender, instance, created, **kwargs):
+    """Drop cached home page user counts when a user signs up."""
+    if created:
+        cache.delete(HOME_STATS_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_cache(sender, **kwargs):
+    """Drop cached category lists when a category changes."""
+    cache.delete(CATEGORIES_CACHE_KEY)
+
+
+def refresh_course_progress(course_id):
+    """Recount a course's mandatory contents and recompute its enrollments' progress."""
+    update_mandatory_content_count(course_id)
+    recompute_course_progress(course_id)
+
+
+@receiver(post_save, sender=Content)
+def refresh_progress_on_content_save(sender, instance, created, update_fields, **kwargs):
+    """Refresh progress when mandatory content is added or a content's is_mandatory flips."""
+    if created:
+        changed = instance.is_mandatory
+    elif update_fields is not None and 'is_mandatory' not in update_fields:
+        changed = False
+    else:
+        # Unknown when the instance was not loaded from the database (or the flag was deferred)
+        loaded = getattr(instance, '_loaded_is_mandatory', None)
+        changed = loaded is None or loaded != instance.is_mandatory
+    instance._loaded_is_mandatory = instance.is_mandatory
+    
+    if changed:
+        refresh_course_progress(instance.course_id)
+
+
+@receiver(post_delete, sender=Content)
+def refresh_progress_on_content_delete(sender, instance, origin=None, **kwargs):
+    """Refresh progress when mandatory content is deleted on its own."""
+    # Course (or teacher) deletes cascade here; the whole course is going away
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is Content and instance.is_mandatory:
+        refresh_course_progress(instance.course_id)
+
+
+@receiver(post_save, sender=Question)
+def refresh_question_count_on_save(sender, instance, created, **kwargs):
+    """Recount the exam's questions when a question is added."""
+    if created:
+        update_question_count(instance.exam_id)
+
+
+@receiver(post_delete, sender=Question)
+def refresh_question_count_on_delete(sender, instance, origin=None, **kwargs):
+    """Recount the exam's questions when a question is deleted on its own."""
+    # Exam (or course) deletes cascade here; the exam is going away
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is Question:
+        update_question_count(instance.exam_id)
+
+
+@receiver(post_save, sender=Enrollment)
+def create_enrollment_progress(sender, instance, created, **kwargs):
+    """Create the progress record alongside a new enrollment."""
+    if created:
+        Progress.objects.get_or_create(
+            student_id=instance.student_id,
+            course_id=instance.course_id
+        )
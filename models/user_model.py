@@ -76,6 +76,10 @@ class User(AbstractUser):
         verbose_name = 'User'
         verbose_name_plural = 'Users'
         ordering = ['-date_joined']
+        indexes = [
+            models.Index(fields=['-date_joined']),
+            models.Index(fields=['role', 'is_active']),
+        ]
     
     def __str__(self):
         return f"{self.get_full_name() or self.username} ({self.get_role_display()})"
@@ -98,10 +102,10 @@ class User(AbstractUser):
     def get_dashboard_url(self):
         """Get the appropriate dashboard URL based on role."""
         if self.is_student:
-            return 'student:dashboard'
+            return 'student_dashboard'
         elif self.is_teacher:
-            return 'teacher:dashboard'
+            return 'teacher_dashboard'
         elif self.is_admin_role:
-            return 'admin:dashboard'
-        return 'home:index'
+            return 'admin_dashboard'
+        return 'home'
 
@@ -0,0 +1,60 @@
+"""Caching helpers."""
+import threading
+import time
+from django.core.cache import cache
+from django.db import connections
+from models.course_model import Category
+
+
+# Home page cache keys
+HOME_COURSES_CACHE_KEY = 'home:courses:v1'
+HOME_STATS_CACHE_KEY = 'home:stats:v1'
+
+# Category list used by course forms and filters
+CATEGORIES_CACHE_KEY = 'categories:v1'
+
+
+def get_or_set_stale(key, compute, soft_timeout, hard_timeout):
+    """
+    Return a cached value, serving it stale while it is being refreshed.
+    
+    The value is kept for ``hard_timeout`` seconds. Once it is older than
+    ``soft_timeout`` seconds the stale value is still returned and a single
+    background thread recomputes it.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return _store(key, compute, soft_timeout, hard_timeout)
+    
+    if entry['fresh_until'] < time.time() and cache.add(f'{key}:refreshing', True, soft_timeout):
+        threading.Thread(
+            target=_refresh_in_background,
+            args=(key, compute, soft_timeout, hard_timeout),
+            daemon=True
+        ).start()
+    
+    return entry['value']
+
+
+def get_categories():
+    """Return all categories, cached until a category changes."""
+    return cache.get_or_set(
+        CATEGORIES_CACHE_KEY,
+        lambda: list(Category.objects.only('id', 'name', 'slug').order_by('name')),
+        60 * 60
+    )
+
+
+def _store(key, compute, soft_timeout, hard_timeout):
+    value = compute()
+    cache.set(key, {'value': value, 'fresh_until': time.time() + soft_timeout}, hard_timeout)
+    return value
+
+
+def _refresh_in_background(key, compute, soft_timeout, hard_timeout):
+    try:
+        _store(key, compute, soft_timeout, hard_timeout)
+    finally:
+        cache.delete(f'{key}:refreshing')
+        # The thread opened its own database connections
+        connections.close_all()
@@ -2,7 +2,10 @@
 from django.shortcuts import redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.db.models import Q
 from functools import wraps
+from models.course_model import Course
+from models.enrollment_model import Enrollment
 
 
 def role_required(*allowed_roles):
@@ -10,15 +13,23 @@ def role_required(*allowed_roles):
     Decorator to restrict access based on user roles.
     Usage: @role_required('STUDENT', 'TEACHER')
     """
+    # Hash lookup per request instead of a tuple scan
+    allowed = frozenset(allowed_roles)
+    
     def decorator(view_func):
         @wraps(view_func)
         @login_required
         def _wrapped_view(request, *args, **kwargs):
-            if not hasattr(request.user, 'role'):
+            # Resolve the role once per request; stacked decorators reuse it
+            role = getattr(request, '_cached_role', None)
+            if role is None:
+                role = request._cached_role = getattr(request.user, 'role', None)
+            
+            if role is None:
                 messages.error(request, 'Access denied. Invalid user role.')
-                return redirect('home:index')
+                return redirect('home')
             
-            if request.user.role not in allowed_roles:
+            if role not in allowed:
                 messages.error(request, 'You do not have permission to access this page.')
                 return redirect(request.user.get_dashboard_url())
             
@@ -42,89 +53,83 @@ def admin_required(view_func):
     return role_required('ADMIN')(view_func)
 
 
-def enrollment_required(view_func):
+def _course_lookup(kwargs):
+    """Build the course filter from URL kwargs (id takes precedence over slug)."""
+    course_id = kwargs.get('course_id') or kwargs.get('pk')
+    if course_id:
+        return Q(id=course_id)
+    slug = kwargs.get('course_slug') or kwargs.get('slug')
+    if slug:
+        return Q(slug=slug)
+    return None
+
+
+def course_owner_required(view_func):
     """
-    Decorator to check if student is enrolled in a course.
-    Expects 'course_id' or 'slug' in kwargs.
+    Decorator to check if teacher owns the course.
+    Expects 'course_id' or 'course_slug' in kwargs.
     """
     @wraps(view_func)
     @login_required
-    @student_required
+    @teacher_required
     def _wrapped_view(request, *args, **kwargs):
-        from models.course_model import Course
-        from models.enrollment_model import Enrollment
-        
         # Get course from kwargs
-        course_id = kwargs.get('course_id') or kwargs.get('pk')
-        slug = kwargs.get('slug')
+        lookup = _course_lookup(kwargs)
+        if lookup is None:
+            messages.error(request, 'Course not found.')
+            return redirect('my_courses')
         
         try:
-            if course_id:
-                course = Course.objects.get(id=course_id)
-            elif slug:
-                course = Course.objects.get(slug=slug)
-            else:
-                messages.error(request, 'Course not found.')
-                return redirect('student:browse_courses')
-            
-            # Check enrollment
-            enrollment = Enrollment.objects.filter(
-                student=request.user,
-                course=course,
-                is_active=True
-            ).first()
+            course = Course.objects.only('id', 'slug', 'teacher_id').get(lookup)
             
-            if not enrollment:
-                messages.error(request, 'You must be enrolled in this course to access its content.')
-                return redirect('course:detail', slug=course.slug)
+            # Check ownership (compare ids, no teacher fetch)
+            if course.teacher_id != request.user.id:
+                messages.error(request, 'You do not have permission to modify this course.')
+                return redirect('my_courses')
             
-            # Add enrollment to request for easy access in view
-            request.enrollment = enrollment
+            # Add course to request for easy access in view
+            request.course = course
             
         except Course.DoesNotExist:
             messages.error(request, 'Course not found.')
-            return redirect('student:browse_courses')
+            return redirect('my_courses')
         
         return view_func(request, *args, **kwargs)
     return _wrapped_view
 
 
-def course_owner_required(view_func):
+def enrollment_exists_required(view_func):
     """
-    Decorator to check if teacher owns the course.
-    Expects 'course_id' or 'slug' in kwargs.
+    Decorator to check if student is enrolled in a course (EXISTS query, nothing loaded).
+    Expects 'course_id' or 'course_slug' in kwargs.
     """
     @wraps(view_func)
     @login_required
-    @teacher_required
+    @student_required
     def _wrapped_view(request, *args, **kwargs):
-        from models.course_model import Course
-        
         # Get course from kwargs
-        course_id = kwargs.get('course_id') or kwargs.get('pk')
-        slug = kwargs.get('slug')
+        lookup = _course_lookup(kwargs)
+        if lookup is None:
+            messages.error(request, 'Course not found.')
+            return redirect('browse_courses')
         
         try:
-            if course_id:
-                course = Course.objects.get(id=course_id)
-            elif slug:
-                course = Course.objects.get(slug=slug)
-            else:
-                messages.error(request, 'Course not found.')
-                return redirect('teacher:my_courses')
+            course = Course.objects.only('id', 'slug').get(lookup)
             
-            # Check ownership
-            if course.teacher != request.user:
-                messages.error(request, 'You do not have permission to modify this course.')
-                return redirect('teacher:my_courses')
+            # Check enrollment with an EXISTS query
+            is_enrolled = Enrollment.objects.filter(
+                student=request.user,
+                course=course,
+                is_active=True
+            ).exists()
             
-            # Add course to request for easy access in view
-            request.course = course
+            if not is_enrolled:
+                messages.error(request, 'You must be enrolled in this course to access its content.')
+                return redirect('browse_courses')
             
         except Course.DoesNotExist:
             messages.error(request, 'Course not found.')
-            return redirect('teacher:my_courses')
+            return redirect('browse_courses')
         
         return view_func(request, *args, **kwargs)
     return _wrapped_view
-
@@ -2,10 +2,12 @@
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.utils import timezone
+from django.utils.text import slugify
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 import io
+from models.enrollment_model import Certificate
 
 
 def generate_certificate_pdf(enrollment):
@@ -45,7 +47,6 @@ def generate_certificate_pdf(enrollment):
     p.drawCentredString(width / 2, height - 380, f"Completed on: {completion_date}")
     
     # Certificate details
-    from models.enrollment_model import Certificate
     try:
         certificate = enrollment.certificate
         p.setFont("Helvetica", 9)
@@ -98,7 +99,6 @@ def format_duration(minutes):
 
 def generate_unique_slug(model_class, title, max_length=200):
     """Generate a unique slug for a model instance."""
-    from django.utils.text import slugify
     slug = slugify(title)[:max_length]
     unique_slug = slug
     counter = 1
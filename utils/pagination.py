@@ -0,0 +1,86 @@
+"""Keyset (cursor) pagination helpers."""
+import base64
+from datetime import datetime
+from django.db.models import Q
+
+
+class CursorPage:
+    """A single page of keyset-paginated results."""
+
+    def __init__(self, object_list, cursor, next_cursor):
+        self.object_list = object_list
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        # Forward-only: a keyset page has no cursor back to the previous one
+        return False
+
+    def has_other_pages(self):
+        return self.has_next() or self.cursor is not None
+
+
+class CursorPaginator:
+    """
+    Paginate newest-first on a non-null datetime field plus id.
+
+    Each page is fetched with ``WHERE (field, id) < cursor ... LIMIT n``,
+    so deep pages cost the same as the first one, unlike OFFSET.
+    """
+
+    def __init__(self, queryset, field, per_page):
+        self.queryset = queryset.order_by(f'-{field}', '-id')
+        self.field = field
+        self.per_page = per_page
+
+    def get_page(self, cursor):
+        """Return the page after ``cursor``; an invalid cursor gives the first page."""
+        position = self.decode_cursor(cursor) if cursor else None
+        queryset = self.queryset
+        if position is None:
+            cursor = None
+        else:
+            value, pk = position
+            queryset = queryset.filter(
+                Q(**{f'{self.field}__lt': value}) |
+                Q(**{self.field: value, 'id__lt': pk})
+            )
+
+        rows = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(rows) > self.per_page:
+            rows = rows[:self.per_page]
+            last = rows[-1]
+            next_cursor = self.encode_cursor(getattr(last, self.field), last.pk)
+        return CursorPage(rows, cursor, next_cursor)
+
+    @staticmethod
+    def encode_cursor(value, pk):
+        return base64.urlsafe_b64encode(f'{value.isoformat()}|{pk}'.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            value, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(value), int(pk)
+        except (ValueError, UnicodeError):
+            return None
+
+
+class CursorPaginationMixin:
+    """ListView mixin that paginates with ``?cursor=`` instead of ``?page=``."""
+    cursor_field = None
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = CursorPaginator(queryset, self.cursor_field, page_size)
+        page = paginator.get_page(self.request.GET.get('cursor'))
+        return (paginator, page, page.object_list, page.has_other_pages())
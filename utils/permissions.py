@@ -1,5 +1,6 @@
 """Permission classes for REST API."""
 from rest_framework import permissions
+from models.enrollment_model import Enrollment
 
 
 class IsStudent(permissions.BasePermission):
@@ -40,7 +41,6 @@ class IsEnrolled(permissions.BasePermission):
     """Permission class to check if student is enrolled in the course."""
     
     def has_object_permission(self, request, view, obj):
-        from models.enrollment_model import Enrollment
         if not request.user or not request.user.is_authenticated:
             return False
         course = getattr(obj, 'course', obj)